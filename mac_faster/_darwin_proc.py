@@ -0,0 +1,155 @@
+"""Bulk per-process sampling on macOS through ``libproc`` bindings."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import sys
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+PROC_ALL_PIDS = 1
+PROC_PIDTASKALLINFO = 2
+MAXCOMLEN = 16
+
+
+class TaskSample(NamedTuple):
+    pid: int
+    start_time: float
+    name: str
+    name_truncated: bool
+    cpu_time: float
+    rss_bytes: int
+
+
+class _ProcBsdInfo(ctypes.Structure):
+    _fields_ = [
+        ("pbi_flags", ctypes.c_uint32),
+        ("pbi_status", ctypes.c_uint32),
+        ("pbi_xstatus", ctypes.c_uint32),
+        ("pbi_pid", ctypes.c_uint32),
+        ("pbi_ppid", ctypes.c_uint32),
+        ("pbi_uid", ctypes.c_uint32),
+        ("pbi_gid", ctypes.c_uint32),
+        ("pbi_ruid", ctypes.c_uint32),
+        ("pbi_rgid", ctypes.c_uint32),
+        ("pbi_svuid", ctypes.c_uint32),
+        ("pbi_svgid", ctypes.c_uint32),
+        ("rfu_1", ctypes.c_uint32),
+        ("pbi_comm", ctypes.c_char * MAXCOMLEN),
+        ("pbi_name", ctypes.c_char * (2 * MAXCOMLEN)),
+        ("pbi_nfiles", ctypes.c_uint32),
+        ("pbi_pgid", ctypes.c_uint32),
+        ("pbi_pjobc", ctypes.c_uint32),
+        ("e_tdev", ctypes.c_uint32),
+        ("e_tpgid", ctypes.c_uint32),
+        ("pbi_nice", ctypes.c_int32),
+        ("pbi_start_tvsec", ctypes.c_uint64),
+        ("pbi_start_tvusec", ctypes.c_uint64),
+    ]
+
+
+class _ProcTaskInfo(ctypes.Structure):
+    _fields_ = [
+        ("pti_virtual_size", ctypes.c_uint64),
+        ("pti_resident_size", ctypes.c_uint64),
+        ("pti_total_user", ctypes.c_uint64),
+        ("pti_total_system", ctypes.c_uint64),
+        ("pti_threads_user", ctypes.c_uint64),
+        ("pti_threads_system", ctypes.c_uint64),
+        ("pti_policy", ctypes.c_int32),
+        ("pti_faults", ctypes.c_int32),
+        ("pti_pageins", ctypes.c_int32),
+        ("pti_cow_faults", ctypes.c_int32),
+        ("pti_messages_sent", ctypes.c_int32),
+        ("pti_messages_received", ctypes.c_int32),
+        ("pti_syscalls_mach", ctypes.c_int32),
+        ("pti_syscalls_unix", ctypes.c_int32),
+        ("pti_csw", ctypes.c_int32),
+        ("pti_threadnum", ctypes.c_int32),
+        ("pti_numrunning", ctypes.c_int32),
+        ("pti_priority", ctypes.c_int32),
+    ]
+
+
+class _ProcTaskAllInfo(ctypes.Structure):
+    _fields_ = [("pbsd", _ProcBsdInfo), ("ptinfo", _ProcTaskInfo)]
+
+
+class _MachTimebaseInfo(ctypes.Structure):
+    _fields_ = [("numer", ctypes.c_uint32), ("denom", ctypes.c_uint32)]
+
+
+def _load_libproc() -> Optional[ctypes.CDLL]:
+    if sys.platform != "darwin":
+        return None
+    try:
+        lib = ctypes.CDLL("/usr/lib/libproc.dylib", use_errno=True)
+    except OSError:
+        return None
+    lib.proc_listpids.argtypes = [ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_int]
+    lib.proc_listpids.restype = ctypes.c_int
+    lib.proc_pidinfo.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_int]
+    lib.proc_pidinfo.restype = ctypes.c_int
+    return lib
+
+
+def _seconds_per_tick() -> float:
+    # pti_total_* are Mach absolute time units, which are not nanoseconds on Apple Silicon.
+    timebase = _MachTimebaseInfo()
+    libc = ctypes.CDLL(ctypes.util.find_library("c"))
+    if libc.mach_timebase_info(ctypes.byref(timebase)) != 0 or not timebase.denom:
+        return 1e-9
+    return timebase.numer / timebase.denom * 1e-9
+
+
+_LIBPROC = _load_libproc()
+AVAILABLE = _LIBPROC is not None
+_SECONDS_PER_TICK = _seconds_per_tick() if AVAILABLE else 1e-9
+
+
+def list_pids() -> List[int]:
+    """Return every PID known to the kernel."""
+    assert _LIBPROC is not None
+    size = _LIBPROC.proc_listpids(PROC_ALL_PIDS, 0, None, 0)
+    if size <= 0:
+        return []
+    # Leave headroom for processes spawned between the sizing and the filling call.
+    count = size // ctypes.sizeof(ctypes.c_int) + 64
+    buffer = (ctypes.c_int * count)()
+    filled = _LIBPROC.proc_listpids(PROC_ALL_PIDS, 0, buffer, ctypes.sizeof(buffer))
+    return [pid for pid in buffer[: max(filled, 0) // ctypes.sizeof(ctypes.c_int)] if pid > 0]
+
+
+def task_samples() -> Iterator[TaskSample]:
+    """Yield name, cumulative CPU time and resident size for every accessible process."""
+    assert _LIBPROC is not None
+    info = _ProcTaskAllInfo()
+    info_size = ctypes.sizeof(info)
+    for pid in list_pids():
+        if _LIBPROC.proc_pidinfo(pid, PROC_PIDTASKALLINFO, 0, ctypes.byref(info), info_size) != info_size:
+            # The process exited or belongs to another user; psutil would raise here as well.
+            continue
+        bsd = info.pbsd
+        start_time = bsd.pbi_start_tvsec + bsd.pbi_start_tvusec / 1e6
+        name, name_truncated = _bsd_name(bsd)
+        task = info.ptinfo
+        yield TaskSample(
+            pid=pid,
+            start_time=start_time,
+            name=name,
+            name_truncated=name_truncated,
+            cpu_time=(task.pti_total_user + task.pti_total_system) * _SECONDS_PER_TICK,
+            rss_bytes=task.pti_resident_size,
+        )
+
+
+def _bsd_name(bsd: _ProcBsdInfo) -> Tuple[str, bool]:
+    """Return the process name and whether it may have been cut off.
+
+    ``pbi_name`` holds up to ``2 * MAXCOMLEN`` characters. When it is empty, ``pbi_comm`` is used
+    instead, and that one is cut off at ``MAXCOMLEN`` characters.
+    """
+    if bsd.pbi_name:
+        return bsd.pbi_name.decode("utf-8", "replace"), False
+    name = bsd.pbi_comm.decode("utf-8", "replace")
+    return name, len(name) >= MAXCOMLEN - 1
@@ -1,20 +1,28 @@
-"""Entry point for the mac-faster command line tool."""
+"""Entry point for the mac-faster command line tool.
+
+Rich, psutil and the collectors are imported lazily so that ``--help`` stays fast;
+check with ``python -X importtime -m mac_faster.cli --help``.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import asdict
-from typing import Any, Dict
-
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from typing import TYPE_CHECKING, Any, Dict
 
-from .diagnostics import Bottleneck, diagnose
 from .formatting import format_bytes, format_snapshot, render_table
-from .system_state import SystemSnapshot, gather_snapshot
+
+_UNLOADED = object()
+# Resolved on first use by _load_orjson(): importing orjson costs ~10 ms, which --help should not pay.
+orjson: Any = _UNLOADED
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from .diagnostics import Bottleneck
+    from .system_state import DiskUsage, ProcessUsage, SystemSnapshot
+
+__all__ = ["main"]
 
 
 def main() -> None:
@@ -26,6 +34,9 @@ def main() -> None:
     parser.add_argument("--ui", action="store_true", help="以 Rich 风格输出更美观的终端 UI")
     args = parser.parse_args()
 
+    from .diagnostics import diagnose
+    from .system_state import gather_snapshot
+
     snapshot = gather_snapshot(top_n=args.top)
     bottlenecks = diagnose(snapshot)
 
@@ -53,14 +64,90 @@ def _format_bottlenecks(bottlenecks: list[Bottleneck]) -> str:
     return render_table(["问题", "原因", "证据", "解决方案"], rows)
 
 
+def _load_orjson() -> Any:
+    global orjson
+    if orjson is _UNLOADED:
+        try:
+            import orjson as module
+        except ImportError:  # optional: pip install "mac-faster[fast]"
+            module = None
+        orjson = module
+    return orjson
+
+
 def _to_json(snapshot: SystemSnapshot, bottlenecks: list[Bottleneck]) -> str:
-    snapshot_dict: Dict[str, Any] = asdict(snapshot)
-    snapshot_dict["timestamp"] = snapshot.timestamp.isoformat()
-    payload: Dict[str, Any] = {"snapshot": snapshot_dict, "bottlenecks": [asdict(b) for b in bottlenecks]}
+    fast_json = _load_orjson()
+    if fast_json is not None:
+        # orjson encodes dataclasses, datetimes and tuples natively, so no intermediate dict tree is built.
+        # The decoded data matches the json fallback, but the text does not: floats are spelled 1e-7
+        # rather than 1e-07, NaN becomes null, and integers beyond 64 bits are rejected.
+        return fast_json.dumps({"snapshot": snapshot, "bottlenecks": bottlenecks}, option=fast_json.OPT_INDENT_2).decode()
+    payload: Dict[str, Any] = {
+        "snapshot": _snapshot_to_dict(snapshot),
+        "bottlenecks": [_bottleneck_to_dict(b) for b in bottlenecks],
+    }
     return json.dumps(payload, ensure_ascii=False, indent=2)
 
 
+# Hand-written field mappings: dataclasses.asdict deep-copies every nested object reflectively.
+def _snapshot_to_dict(snapshot: SystemSnapshot) -> Dict[str, Any]:
+    return {
+        "timestamp": snapshot.timestamp.isoformat(),
+        "cpu_percent": snapshot.cpu_percent,
+        "load_avg": list(snapshot.load_avg),
+        "cpu_count": snapshot.cpu_count,
+        "memory_total": snapshot.memory_total,
+        "memory_used": snapshot.memory_used,
+        "memory_percent": snapshot.memory_percent,
+        "swap_total": snapshot.swap_total,
+        "swap_used": snapshot.swap_used,
+        "swap_percent": snapshot.swap_percent,
+        "disk_io_read_bytes": snapshot.disk_io_read_bytes,
+        "disk_io_write_bytes": snapshot.disk_io_write_bytes,
+        "battery_percent": snapshot.battery_percent,
+        "power_plugged": snapshot.power_plugged,
+        "top_cpu_processes": [_process_to_dict(p) for p in snapshot.top_cpu_processes],
+        "top_memory_processes": [_process_to_dict(p) for p in snapshot.top_memory_processes],
+        "disk_usages": [_disk_to_dict(d) for d in snapshot.disk_usages],
+    }
+
+
+def _process_to_dict(proc: ProcessUsage) -> Dict[str, Any]:
+    return {
+        "pid": proc.pid,
+        "name": proc.name,
+        "cpu_percent": proc.cpu_percent,
+        "memory_percent": proc.memory_percent,
+        "rss_bytes": proc.rss_bytes,
+        "read_bytes": proc.read_bytes,
+        "write_bytes": proc.write_bytes,
+    }
+
+
+def _disk_to_dict(disk: DiskUsage) -> Dict[str, Any]:
+    return {
+        "mount_point": disk.mount_point,
+        "total_gb": disk.total_gb,
+        "used_gb": disk.used_gb,
+        "percent": disk.percent,
+    }
+
+
+def _bottleneck_to_dict(bottleneck: Bottleneck) -> Dict[str, Any]:
+    return {
+        "title": bottleneck.title,
+        "issue": bottleneck.issue,
+        "evidence": bottleneck.evidence,
+        "solutions": list(bottleneck.solutions),
+    }
+
+
 def _render_rich(snapshot: SystemSnapshot, bottlenecks: list[Bottleneck]) -> None:
+    from rich import box
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
     console = Console()
 
     console.print(Panel(f"系统快照 - {snapshot.timestamp:%Y-%m-%d %H:%M:%S}", style="bold cyan"))
@@ -109,6 +196,9 @@ def _render_rich(snapshot: SystemSnapshot, bottlenecks: list[Bottleneck]) -> Non
 
 
 def _rich_process_table(title: str, processes: list[Any]) -> Table:
+    from rich import box
+    from rich.table import Table
+
     table = Table(title=title, box=box.SIMPLE_HEAD)
     table.add_column("PID", justify="right")
     table.add_column("进程")
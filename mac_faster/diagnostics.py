@@ -3,12 +3,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence
+import sys
+from typing import Any, Dict, List, Sequence
 
 from .system_state import DiskUsage, ProcessUsage, SystemSnapshot
 
+# dataclass(slots=True) only exists on Python 3.10+; the project still supports 3.8.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+_CPU_HOT_PERCENT = 85
+_LOAD_HOT_FACTOR = 1.5
+_MEMORY_HOT_PERCENT = 85
+_DISK_WARN_PERCENT = 85
+_SWAP_WARN_PERCENT = 15
+_SWAP_SEVERE_PERCENT = 40
+_BATTERY_LOW_PERCENT = 20
+
+# perf: intentionally not JIT-compiled. The loops below touch a handful of disks and the top-N
+# processes once per CLI run; Numba's compile latency (hundreds of ms) would never pay for itself.
+# Revisit only for a long-running watch mode, and keep it behind NUMBA_DISABLE_JIT.
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Bottleneck:
     title: str
     issue: str
@@ -18,24 +34,46 @@ class Bottleneck:
 
 def diagnose(snapshot: SystemSnapshot) -> List[Bottleneck]:
     """Analyze a system snapshot and return likely bottlenecks with fixes."""
-    bottlenecks: List[Bottleneck] = []
+    cpu_pressure = _cpu_pressure(snapshot)
+    memory_hot = snapshot.memory_percent >= _MEMORY_HOT_PERCENT
+    disk_full = any(disk.percent >= _DISK_WARN_PERCENT for disk in snapshot.disk_usages)
+    swap_busy = snapshot.swap_percent >= _SWAP_WARN_PERCENT
+    battery_low = _battery_low(snapshot)
+    # Healthy machines are the common case: skip the detailed checks and their string building.
+    if not (cpu_pressure or memory_hot or disk_full or swap_busy or battery_low):
+        return []
 
-    bottlenecks.extend(_diagnose_cpu(snapshot))
-    bottlenecks.extend(_diagnose_memory(snapshot))
-    bottlenecks.extend(_diagnose_disk(snapshot.disk_usages))
-    bottlenecks.extend(_diagnose_swap(snapshot.swap_percent))
-    battery_note = _diagnose_battery(snapshot)
-    if battery_note:
-        bottlenecks.append(battery_note)
+    bottlenecks: List[Bottleneck] = []
+    if cpu_pressure:
+        bottlenecks.extend(_diagnose_cpu(snapshot, cpu_pressure))
+    if memory_hot:
+        bottlenecks.extend(_diagnose_memory(snapshot))
+    if disk_full:
+        bottlenecks.extend(_diagnose_disk(snapshot.disk_usages))
+    if swap_busy:
+        bottlenecks.extend(_diagnose_swap(snapshot.swap_percent))
+    if battery_low:
+        battery_note = _diagnose_battery(snapshot)
+        if battery_note:
+            bottlenecks.append(battery_note)
 
     return bottlenecks
 
 
-def _diagnose_cpu(snapshot: SystemSnapshot) -> List[Bottleneck]:
+def _cpu_pressure(snapshot: SystemSnapshot) -> str | None:
+    """Classify CPU load as ``"overloaded"``, ``"busy"`` or ``None`` when it is fine."""
+    load_1m = snapshot.load_avg[0]
+    if snapshot.cpu_percent >= _CPU_HOT_PERCENT or load_1m >= snapshot.cpu_count * _LOAD_HOT_FACTOR:
+        return "overloaded"
+    if load_1m > snapshot.cpu_count:
+        return "busy"
+    return None
+
+
+def _diagnose_cpu(snapshot: SystemSnapshot, pressure: str | None) -> List[Bottleneck]:
     findings: List[Bottleneck] = []
     load_1m, load_5m, _ = snapshot.load_avg
-    overloaded = snapshot.cpu_percent >= 85 or load_1m >= snapshot.cpu_count * 1.5
-    if overloaded:
+    if pressure == "overloaded":
         offenders = _top_process_summary(snapshot.top_cpu_processes)
         findings.append(
             Bottleneck(
@@ -49,7 +87,7 @@ def _diagnose_cpu(snapshot: SystemSnapshot) -> List[Bottleneck]:
                 ],
             )
         )
-    elif load_1m > snapshot.cpu_count:
+    elif pressure == "busy":
         findings.append(
             Bottleneck(
                 title="CPU 负载偏高",
@@ -66,7 +104,7 @@ def _diagnose_cpu(snapshot: SystemSnapshot) -> List[Bottleneck]:
 
 def _diagnose_memory(snapshot: SystemSnapshot) -> List[Bottleneck]:
     findings: List[Bottleneck] = []
-    if snapshot.memory_percent >= 85:
+    if snapshot.memory_percent >= _MEMORY_HOT_PERCENT:
         offenders = _top_process_summary(snapshot.top_memory_processes)
         findings.append(
             Bottleneck(
@@ -86,7 +124,7 @@ def _diagnose_memory(snapshot: SystemSnapshot) -> List[Bottleneck]:
 def _diagnose_disk(disks: Sequence[DiskUsage]) -> List[Bottleneck]:
     findings: List[Bottleneck] = []
     for disk in disks:
-        if disk.percent >= 85:
+        if disk.percent >= _DISK_WARN_PERCENT:
             findings.append(
                 Bottleneck(
                     title="磁盘空间不足",
@@ -103,9 +141,9 @@ def _diagnose_disk(disks: Sequence[DiskUsage]) -> List[Bottleneck]:
 
 
 def _diagnose_swap(swap_percent: float) -> List[Bottleneck]:
-    if swap_percent < 15:
+    if swap_percent < _SWAP_WARN_PERCENT:
         return []
-    severity = "频繁" if swap_percent >= 40 else "明显"
+    severity = "频繁" if swap_percent >= _SWAP_SEVERE_PERCENT else "明显"
     return [
         Bottleneck(
             title="Swap 读写",
@@ -119,10 +157,16 @@ def _diagnose_swap(swap_percent: float) -> List[Bottleneck]:
     ]
 
 
+def _battery_low(snapshot: SystemSnapshot) -> bool:
+    return (
+        snapshot.battery_percent is not None
+        and not snapshot.power_plugged
+        and snapshot.battery_percent < _BATTERY_LOW_PERCENT
+    )
+
+
 def _diagnose_battery(snapshot: SystemSnapshot) -> Bottleneck | None:
-    if snapshot.battery_percent is None:
-        return None
-    if not snapshot.power_plugged and snapshot.battery_percent < 20:
+    if _battery_low(snapshot):
         return Bottleneck(
             title="电量过低",
             issue="电池电量低于 20%，系统可能自动降频。",
@@ -2,54 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+import math
+from typing import TYPE_CHECKING, Iterable, Sequence
 
-from .system_state import DiskUsage, ProcessUsage, SystemSnapshot
+if TYPE_CHECKING:
+    from .system_state import DiskUsage, ProcessUsage, SystemSnapshot
+
+_BYTE_SUFFIXES = ("B", "KiB", "MiB", "GiB", "TiB")
+_PROCESS_HEADERS = ("PID", "进程", "CPU", "内存", "常驻内存")
+_DISK_HEADERS = ("挂载点", "已用 / 总计", "占用")
 
 
 def format_bytes(num: float) -> str:
-    suffixes = ["B", "KiB", "MiB", "GiB", "TiB"]
-    value = float(num)
-    for suffix in suffixes:
-        if value < 1024 or suffix == suffixes[-1]:
-            return f"{value:.1f} {suffix}"
-        value /= 1024
-    return f"{value:.1f} TiB"
+    if not math.isfinite(num):
+        # int() rejects these; keep the suffixes the division loop used to end on.
+        return f"{num:.1f} {_BYTE_SUFFIXES[0] if num < 0 else _BYTE_SUFFIXES[-1]}"
+    # floor(log2(num)) // 10 picks the suffix; bit_length keeps it exact and loop-free.
+    index = min((max(int(num), 1).bit_length() - 1) // 10, len(_BYTE_SUFFIXES) - 1)
+    return f"{num / (1 << (index * 10)):.1f} {_BYTE_SUFFIXES[index]}"
 
 
 def render_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
-    widths = [len(h) for h in headers]
-    for row in rows:
-        for index, cell in enumerate(row):
-            widths[index] = max(widths[index], len(cell))
-    lines = []
-    lines.append(_format_row(headers, widths))
-    lines.append(_format_row(["-" * w for w in widths], widths))
-    for row in rows:
-        lines.append(_format_row(row, widths))
-    return "\n".join(lines)
+    widths = [max(map(len, column)) for column in zip(headers, *rows)]
+    separator = ["-" * width for width in widths]
+    return "\n".join(
+        " | ".join(cell.ljust(width) for cell, width in zip(row, widths))
+        for row in (headers, separator, *rows)
+    )
 
 
 def format_process_table(processes: Iterable[ProcessUsage]) -> str:
+    # f-strings compile their format specs into bytecode, which beats re-parsing a str.format template per row.
     rows = [
-        [
+        (
             str(proc.pid),
             proc.name,
             f"{proc.cpu_percent:.0f}%",
             f"{proc.memory_percent:.0f}%",
             format_bytes(proc.rss_bytes),
-        ]
+        )
         for proc in processes
     ]
-    return render_table(["PID", "进程", "CPU", "内存", "常驻内存"], rows) if rows else "无进程数据"
+    return render_table(_PROCESS_HEADERS, rows) if rows else "无进程数据"
 
 
 def format_disk_table(disks: Iterable[DiskUsage]) -> str:
     rows = [
-        [disk.mount_point, f"{disk.used_gb:.1f} / {disk.total_gb:.1f} GiB", f"{disk.percent:.0f}%"]
+        (disk.mount_point, f"{disk.used_gb:.1f} / {disk.total_gb:.1f} GiB", f"{disk.percent:.0f}%")
         for disk in disks
     ]
-    return render_table(["挂载点", "已用 / 总计", "占用"], rows) if rows else "无磁盘数据"
+    return render_table(_DISK_HEADERS, rows) if rows else "无磁盘数据"
 
 
 def format_snapshot(snapshot: SystemSnapshot) -> str:
@@ -67,8 +69,3 @@ def format_snapshot(snapshot: SystemSnapshot) -> str:
     lines.append("内存占用 Top：")
     lines.append(format_process_table(snapshot.top_memory_processes))
     return "\n".join(lines)
-
-
-def _format_row(row: Sequence[str], widths: Sequence[int]) -> str:
-    padded = [cell.ljust(width) for cell, width in zip(row, widths)]
-    return " | ".join(padded)
@@ -2,16 +2,47 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+import heapq
 import os
+import sys
 import time
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import psutil
 
+from . import _darwin_proc
 
-@dataclass
+# Slots keep the per-process records compact; dataclass(slots=True) needs Python 3.10+.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_PRIME_INTERVAL = 0.1
+_PARTITIONS_TTL = 60.0
+_MAX_WORKERS = min(8, os.cpu_count() or 4)
+_SPARE_CANDIDATES = 3
+# psutil has no per-process I/O counters on macOS, so read_bytes/write_bytes stay 0 there instead of
+# paying for a failing call per process.
+_IO_COUNTERS_SUPPORTED = hasattr(psutil.Process, "io_counters")
+
+# Cumulative CPU seconds per (pid, start time) from the previous sample, used to derive per-process
+# CPU percentages. The start time keeps a recycled PID from being charged against a dead process.
+_PREV_CPU_TIMES: Dict[Tuple[int, float], float] = {}
+_PREV_WALL: Optional[float] = None
+
+# psutil resolves long names through the executable path or command line; names are stable for a
+# process' lifetime, and keying on create time keeps a recycled PID from inheriting a stale name.
+_NAME_CACHE_SIZE = 2048
+_NAME_CACHE: "OrderedDict[Tuple[int, float], str]" = OrderedDict()
+
+# Mounted partitions rarely change; refresh them on a TTL so newly attached volumes still show up.
+_PARTITIONS_CACHE: Tuple[float, List[Any]] = (float("-inf"), [])
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessUsage:
     pid: int
     name: str
@@ -22,7 +53,7 @@ class ProcessUsage:
     write_bytes: int
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DiskUsage:
     mount_point: str
     total_gb: float
@@ -30,7 +61,7 @@ class DiskUsage:
     percent: float
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemSnapshot:
     timestamp: datetime
     cpu_percent: float
@@ -51,19 +82,41 @@ class SystemSnapshot:
     disk_usages: List[DiskUsage] = field(default_factory=list)
 
 
+class _ProcessSample(NamedTuple):
+    """Cheap per-process reading used to rank processes before fetching their details."""
+
+    pid: int
+    start_time: float
+    cpu_time: float
+    cpu_delta: float
+    rss_bytes: int
+    name: Optional[str] = None
+    name_truncated: bool = False
+
+
+# (rank key, negated scan order, sample); the order term is unique, so samples are never compared.
+_HeapEntry = Tuple[float, int, _ProcessSample]
+
+
 def gather_snapshot(top_n: int = 5) -> SystemSnapshot:
-    """Collect a snapshot of the current system health."""
-    cpu_count = psutil.cpu_count() or 0
+    """Collect a snapshot of the current system health.
+
+    Only the first call in a process waits ``_PRIME_INTERVAL`` to establish a CPU-time baseline;
+    later calls measure CPU usage against the previous snapshot without sleeping.
+    """
+    cpu_count = _cpu_count_cached()
     load_avg = os.getloadavg() if hasattr(os, "getloadavg") else (0.0, 0.0, 0.0)
-    cpu_percent = psutil.cpu_percent(interval=0.3)
     memory = psutil.virtual_memory()
     swap = psutil.swap_memory()
     disk_counters = psutil.disk_io_counters()
     battery = psutil.sensors_battery()
 
-    processes = list(psutil.process_iter())
-    _prime_cpu_percent(processes)
-    process_usages = _process_usage(processes)
+    if _darwin_proc.AVAILABLE:
+        top_cpu, top_memory = _darwin_top_processes(memory.total, top_n)
+    else:
+        top_cpu, top_memory = _psutil_top_processes(list(psutil.process_iter()), memory.total, top_n)
+    # Sampled after the per-process window so that even the first call covers a non-empty interval.
+    cpu_percent = psutil.cpu_percent(interval=None)
 
     disk_usages = _disk_usage_summary()
 
@@ -82,70 +135,251 @@ def gather_snapshot(top_n: int = 5) -> SystemSnapshot:
         disk_io_write_bytes=disk_counters.write_bytes if disk_counters else 0,
         battery_percent=battery.percent if battery else None,
         power_plugged=battery.power_plugged if battery else None,
-        top_cpu_processes=sorted(process_usages, key=lambda p: p.cpu_percent, reverse=True)[:top_n],
-        top_memory_processes=sorted(
-            process_usages, key=lambda p: p.memory_percent, reverse=True
-        )[:top_n],
+        top_cpu_processes=top_cpu,
+        top_memory_processes=top_memory,
         disk_usages=disk_usages,
     )
 
 
-def _prime_cpu_percent(processes: Iterable[psutil.Process]) -> None:
-    for proc in processes:
-        try:
-            proc.cpu_percent(None)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-    time.sleep(0.1)
+def _psutil_top_processes(
+    processes: List[psutil.Process], memory_total: int, top_n: int
+) -> Tuple[List[ProcessUsage], List[ProcessUsage]]:
+    _ensure_cpu_baseline(lambda: _cpu_times_by_process(_cheap_scan(processes)))
+    by_pid = {proc.pid: proc for proc in processes}
+    return _top_processes(
+        _cheap_scan(processes),
+        top_n,
+        lambda sample, cpu_scale: _enrich(sample, by_pid[sample.pid], memory_total, cpu_scale),
+    )
 
 
-def _process_usage(processes: Iterable[psutil.Process]) -> List[ProcessUsage]:
-    usage: List[ProcessUsage] = []
-    for proc in processes:
-        try:
-            with proc.oneshot():
-                cpu = proc.cpu_percent(None)
-                mem_percent = proc.memory_percent()
-                mem_info = proc.memory_info()
+def _cheap_scan(processes: List[psutil.Process]) -> Iterator[_ProcessSample]:
+    # Serial on purpose: macOS takes the libproc path, and elsewhere psutil parses /proc while holding
+    # the GIL, so a thread pool measured slower than this plain loop.
+    for sample in map(_collect_one, processes):
+        if sample is not None:
+            yield sample
+
+
+def _collect_one(proc: psutil.Process) -> Optional[_ProcessSample]:
+    try:
+        with proc.oneshot():
+            times = proc.cpu_times()
+            rss_bytes = proc.memory_info().rss
+            start_time = proc.create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+    cpu_time = times.user + times.system
+    return _ProcessSample(
+        pid=proc.pid,
+        start_time=start_time,
+        cpu_time=cpu_time,
+        cpu_delta=_cpu_delta(proc.pid, start_time, cpu_time),
+        rss_bytes=rss_bytes,
+    )
+
+
+def _enrich(
+    sample: _ProcessSample, proc: psutil.Process, memory_total: int, cpu_scale: float
+) -> Optional[ProcessUsage]:
+    try:
+        with proc.oneshot():
+            name = _process_name(proc.pid, proc.create_time(), proc.name)
+            read_bytes = write_bytes = 0
+            if _IO_COUNTERS_SUPPORTED:
                 try:
                     io_counters = proc.io_counters() if proc.is_running() else None
                     read_bytes = io_counters.read_bytes if io_counters else 0
                     write_bytes = io_counters.write_bytes if io_counters else 0
-                except (AttributeError, psutil.AccessDenied):
-                    # Some processes may not support io_counters or require special permissions
-                    read_bytes = 0
-                    write_bytes = 0
-                usage.append(
-                    ProcessUsage(
-                        pid=proc.pid,
-                        name=proc.name(),
-                        cpu_percent=cpu,
-                        memory_percent=mem_percent,
-                        rss_bytes=mem_info.rss,
-                        read_bytes=read_bytes,
-                        write_bytes=write_bytes,
-                    )
-                )
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-    return usage
+                except psutil.AccessDenied:
+                    # Other users' processes need special permissions
+                    pass
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+    return ProcessUsage(
+        pid=sample.pid,
+        name=name,
+        cpu_percent=sample.cpu_delta * cpu_scale,
+        memory_percent=_memory_percent(sample.rss_bytes, memory_total),
+        rss_bytes=sample.rss_bytes,
+        read_bytes=read_bytes,
+        write_bytes=write_bytes,
+    )
+
+
+def _process_name(pid: int, create_time: float, resolve: Callable[[], str]) -> str:
+    # Keyed by create time as well, so a recycled PID never inherits the dead process's name.
+    key = (pid, create_time)
+    name = _NAME_CACHE.get(key)
+    if name is None:
+        name = resolve()
+        _NAME_CACHE[key] = name
+        if len(_NAME_CACHE) > _NAME_CACHE_SIZE:
+            _NAME_CACHE.popitem(last=False)
+    else:
+        _NAME_CACHE.move_to_end(key)
+    return name
+
+
+def _darwin_top_processes(memory_total: int, top_n: int) -> Tuple[List[ProcessUsage], List[ProcessUsage]]:
+    _ensure_cpu_baseline(lambda: _cpu_times_by_process(_darwin_proc.task_samples()))
+    samples = (
+        _ProcessSample(
+            pid=task.pid,
+            start_time=task.start_time,
+            cpu_time=task.cpu_time,
+            cpu_delta=_cpu_delta(task.pid, task.start_time, task.cpu_time),
+            rss_bytes=task.rss_bytes,
+            name=task.name,
+            name_truncated=task.name_truncated,
+        )
+        for task in _darwin_proc.task_samples()
+    )
+    return _top_processes(samples, top_n, lambda sample, cpu_scale: _darwin_enrich(sample, memory_total, cpu_scale))
+
+
+def _darwin_enrich(sample: _ProcessSample, memory_total: int, cpu_scale: float) -> Optional[ProcessUsage]:
+    name = sample.name or ""
+    # Only names that fell back to pbi_comm can be cut off; widen those for the survivors alone.
+    if sample.name_truncated:
+        try:
+            name = _process_name(sample.pid, sample.start_time, lambda: psutil.Process(sample.pid).name())
+        except psutil.NoSuchProcess:
+            return None
+        except psutil.AccessDenied:
+            pass
+    return ProcessUsage(
+        pid=sample.pid,
+        name=name,
+        cpu_percent=sample.cpu_delta * cpu_scale,
+        memory_percent=_memory_percent(sample.rss_bytes, memory_total),
+        rss_bytes=sample.rss_bytes,
+        # libproc does not expose per-process disk I/O without extra rusage calls.
+        read_bytes=0,
+        write_bytes=0,
+    )
+
+
+def _top_processes(
+    samples: Iterable[_ProcessSample],
+    top_n: int,
+    enrich: Callable[[_ProcessSample, float], Optional[ProcessUsage]],
+) -> Tuple[List[ProcessUsage], List[ProcessUsage]]:
+    """Rank cheap samples in one pass and only fetch full details for the processes that make the cut.
+
+    The CPU times seen along the way become the baseline for the next snapshot. ``enrich`` returns
+    ``None`` for a process that went away since the scan; the next-ranked candidate takes its place.
+    """
+    # A few spare candidates per ranking cover processes that exit before they are enriched.
+    heap_size = top_n + _SPARE_CANDIDATES if top_n > 0 else 0
+    # Heap entries carry the negated scan order so ties keep the first-seen process, like sorted().
+    cpu_heap: List[_HeapEntry] = []
+    memory_heap: List[_HeapEntry] = []
+    cpu_times: Dict[Tuple[int, float], float] = {}
+    for order, sample in enumerate(samples):
+        cpu_times[(sample.pid, sample.start_time)] = sample.cpu_time
+        _push_bounded(cpu_heap, (sample.cpu_delta, -order, sample), heap_size)
+        _push_bounded(memory_heap, (sample.rss_bytes, -order, sample), heap_size)
+    # Like the baseline, the wall clock is read once the scan is done so both windows line up.
+    now = time.monotonic()
+    elapsed = now - _PREV_WALL if _PREV_WALL is not None else 0.0
+    _remember_cpu_times(cpu_times, now)
+    cpu_scale = 100 / elapsed if elapsed > 0 else 0.0
+
+    # Shared between both rankings so a process in both is only enriched once.
+    details: Dict[int, Optional[ProcessUsage]] = {}
+
+    def take(heap: List[_HeapEntry]) -> List[ProcessUsage]:
+        picked: List[ProcessUsage] = []
+        for _, _, sample in sorted(heap, reverse=True):
+            if len(picked) == top_n:
+                break
+            if sample.pid not in details:
+                details[sample.pid] = enrich(sample, cpu_scale)
+            usage = details[sample.pid]
+            if usage is not None:
+                picked.append(usage)
+        return picked
+
+    return take(cpu_heap), take(memory_heap)
+
+
+def _push_bounded(heap: List[_HeapEntry], item: _HeapEntry, size: int) -> None:
+    if len(heap) < size:
+        heapq.heappush(heap, item)
+    elif heap and item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+
+def _memory_percent(rss_bytes: int, memory_total: int) -> float:
+    return rss_bytes / memory_total * 100 if memory_total else 0.0
+
+
+def _ensure_cpu_baseline(sample_cpu_times: Callable[[], Dict[Tuple[int, float], float]]) -> None:
+    if _PREV_WALL is not None:
+        return
+    psutil.cpu_percent(interval=None)
+    _remember_cpu_times(sample_cpu_times(), time.monotonic())
+    time.sleep(_PRIME_INTERVAL)
+
+
+def _cpu_times_by_process(samples: Iterable[Any]) -> Dict[Tuple[int, float], float]:
+    return {(sample.pid, sample.start_time): sample.cpu_time for sample in samples}
+
+
+def _cpu_delta(pid: int, start_time: float, cpu_time: float) -> float:
+    previous = _PREV_CPU_TIMES.get((pid, start_time))
+    if previous is None:
+        return 0.0
+    return max(cpu_time - previous, 0.0)
+
+
+def _remember_cpu_times(cpu_times: Dict[Tuple[int, float], float], wall: float) -> None:
+    global _PREV_WALL
+    _PREV_CPU_TIMES.clear()
+    _PREV_CPU_TIMES.update(cpu_times)
+    _PREV_WALL = wall
+
+
+@lru_cache(maxsize=1)
+def _cpu_count_cached() -> int:
+    return psutil.cpu_count() or 0
+
+
+def _partitions_cached() -> List[Any]:
+    global _PARTITIONS_CACHE
+    now = time.monotonic()
+    if now - _PARTITIONS_CACHE[0] > _PARTITIONS_TTL:
+        _PARTITIONS_CACHE = (now, list(psutil.disk_partitions(all=False)))
+    return _PARTITIONS_CACHE[1]
 
 
 def _disk_usage_summary() -> List[DiskUsage]:
+    mount_points = [partition.mountpoint for partition in _partitions_cached() if "rw" in partition.opts]
+    if len(mount_points) > 1:
+        # statfs can block on network volumes; query them concurrently so the slowest one bounds the wait.
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(mount_points))) as executor:
+            usages = list(executor.map(_safe_disk_usage, mount_points))
+    else:
+        usages = [_safe_disk_usage(mount_point) for mount_point in mount_points]
+
     disk_usages: List[DiskUsage] = []
-    for partition in psutil.disk_partitions(all=False):
-        if "rw" not in partition.opts:
-            continue
-        try:
-            usage = psutil.disk_usage(partition.mountpoint)
-        except PermissionError:
+    for mount_point, usage in zip(mount_points, usages):
+        if usage is None:
             continue
         disk_usages.append(
             DiskUsage(
-                mount_point=partition.mountpoint,
+                mount_point=mount_point,
                 total_gb=round(usage.total / (1024**3), 2),
                 used_gb=round(usage.used / (1024**3), 2),
                 percent=usage.percent,
             )
         )
     return disk_usages
+
+
+def _safe_disk_usage(mount_point: str) -> Optional[Any]:
+    try:
+        return psutil.disk_usage(mount_point)
+    except PermissionError:
+        return None
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from mac_faster import cli
+from mac_faster.diagnostics import diagnose
+from mac_faster.system_state import DiskUsage, ProcessUsage
+
+from test_diagnostics import make_snapshot
+
+
+def test_orjson_and_stdlib_json_decode_to_same_payload(monkeypatch):
+    real_orjson = pytest.importorskip("orjson")
+    process = ProcessUsage(
+        pid=42,
+        name="编译器",
+        cpu_percent=1e-7,
+        memory_percent=93.5,
+        rss_bytes=12 * 1024**3,
+        read_bytes=0,
+        write_bytes=3 * 1024**4,
+    )
+    snapshot = make_snapshot(
+        cpu_percent=97.25,
+        memory_percent=93.5,
+        top_cpu_processes=[process],
+        top_memory_processes=[process],
+        disk_usages=[DiskUsage(mount_point="/", total_gb=460.4, used_gb=440.1, percent=95.6)],
+        battery_percent=12.0,
+        power_plugged=False,
+    )
+    bottlenecks = diagnose(snapshot)
+
+    monkeypatch.setattr(cli, "orjson", None)
+    stdlib_output = cli._to_json(snapshot, bottlenecks)
+    monkeypatch.setattr(cli, "orjson", real_orjson)
+    orjson_output = cli._to_json(snapshot, bottlenecks)
+
+    # The text differs (float spelling such as 1e-07 vs 1e-7); the decoded data must not.
+    assert json.loads(orjson_output) == json.loads(stdlib_output)
@@ -0,0 +1,18 @@
+from mac_faster import _darwin_proc
+
+
+def make_bsd_info(*, comm=b"", name=b""):
+    bsd = _darwin_proc._ProcBsdInfo()
+    bsd.pbi_comm = comm
+    bsd.pbi_name = name
+    return bsd
+
+
+def test_bsd_name_prefers_the_long_pbi_name():
+    bsd = make_bsd_info(comm=b"com.apple.WebKi", name=b"com.apple.WebKit.WebContent")
+    assert _darwin_proc._bsd_name(bsd) == ("com.apple.WebKit.WebContent", False)
+
+
+def test_bsd_name_flags_long_pbi_comm_fallback_as_truncated():
+    assert _darwin_proc._bsd_name(make_bsd_info(comm=b"com.apple.WebKi")) == ("com.apple.WebKi", True)
+    assert _darwin_proc._bsd_name(make_bsd_info(comm=b"zsh")) == ("zsh", False)
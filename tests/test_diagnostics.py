@@ -49,6 +49,12 @@ def test_cpu_bottleneck_detected():
     assert any("CPU 热点" == note.title for note in notes)
 
 
+def test_cpu_load_detected_without_high_usage():
+    snapshot = make_snapshot(cpu_percent=30, load_avg=(5.0, 3.0, 2.0), cpu_count=4)
+    notes = diagnose(snapshot)
+    assert [note.title for note in notes] == ["CPU 负载偏高"]
+
+
 def test_memory_pressure_detected():
     offenders = [
         ProcessUsage(pid=2, name="browser", cpu_percent=10, memory_percent=35, rss_bytes=2 * 1024**3, read_bytes=0, write_bytes=0)
@@ -0,0 +1,38 @@
+from mac_faster.formatting import format_bytes, format_process_table, render_table
+from mac_faster.system_state import ProcessUsage
+
+
+def test_format_bytes_picks_binary_suffix():
+    assert format_bytes(0) == "0.0 B"
+    assert format_bytes(1023) == "1023.0 B"
+    assert format_bytes(1024) == "1.0 KiB"
+    assert format_bytes(1536.0) == "1.5 KiB"
+    assert format_bytes(2 * 1024**3) == "2.0 GiB"
+
+
+def test_format_bytes_caps_at_largest_suffix():
+    assert format_bytes(3 * 1024**5) == "3072.0 TiB"
+
+
+def test_format_bytes_handles_non_finite_values():
+    assert format_bytes(float("inf")) == "inf TiB"
+    assert format_bytes(float("nan")) == "nan TiB"
+    assert format_bytes(float("-inf")) == "-inf B"
+
+
+def test_render_table_pads_columns_to_widest_cell():
+    table = render_table(["PID", "进程"], [["1", "kernel_task"], ["12345", "Xcode"]])
+    assert table.splitlines() == [
+        "PID   | 进程         ",
+        "----- | -----------",
+        "1     | kernel_task",
+        "12345 | Xcode      ",
+    ]
+
+
+def test_format_process_table_rows():
+    processes = [
+        ProcessUsage(pid=42, name="Xcode", cpu_percent=120.4, memory_percent=12.2, rss_bytes=1536 * 1024**2, read_bytes=0, write_bytes=0)
+    ]
+    assert format_process_table(processes).splitlines()[-1] == "42  | Xcode | 120% | 12% | 1.5 GiB"
+    assert format_process_table([]) == "无进程数据"
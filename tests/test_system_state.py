@@ -0,0 +1,205 @@
+from collections import OrderedDict, namedtuple
+import threading
+
+import pytest
+
+from mac_faster import _darwin_proc, system_state
+from mac_faster.system_state import ProcessUsage, _ProcessSample
+
+
+@pytest.fixture
+def cpu_baseline(monkeypatch):
+    """Seed the previous CPU sample: taken at wall time 10.0 for processes started at 100.0."""
+    previous = {(1, 100.0): 5.0, (2, 100.0): 1.0}
+    monkeypatch.setattr(system_state, "_PREV_CPU_TIMES", dict(previous))
+    monkeypatch.setattr(system_state, "_PREV_WALL", 10.0)
+    monkeypatch.setattr(system_state.time, "monotonic", lambda: 12.0)
+    return previous
+
+
+def make_sample(pid, cpu_time, *, rss_bytes=0, start_time=100.0):
+    return _ProcessSample(
+        pid=pid,
+        start_time=start_time,
+        cpu_time=cpu_time,
+        cpu_delta=system_state._cpu_delta(pid, start_time, cpu_time),
+        rss_bytes=rss_bytes,
+    )
+
+
+def stub_enrich(sample, cpu_scale):
+    return ProcessUsage(
+        pid=sample.pid,
+        name=f"proc-{sample.pid}",
+        cpu_percent=sample.cpu_delta * cpu_scale,
+        memory_percent=0.0,
+        rss_bytes=sample.rss_bytes,
+        read_bytes=0,
+        write_bytes=0,
+    )
+
+
+def test_cpu_percent_is_delta_over_elapsed(cpu_baseline):
+    samples = [make_sample(1, 6.0), make_sample(2, 1.5)]
+    top_cpu, _ = system_state._top_processes(samples, 5, stub_enrich)
+    # 1.0 s and 0.5 s of CPU over a 2.0 s window.
+    assert [(p.pid, p.cpu_percent) for p in top_cpu] == [(1, 50.0), (2, 25.0)]
+
+
+def test_process_without_previous_sample_reports_zero(cpu_baseline):
+    samples = [make_sample(3, 42.0)]
+    top_cpu, _ = system_state._top_processes(samples, 5, stub_enrich)
+    assert top_cpu[0].cpu_percent == 0.0
+
+
+def test_recycled_pid_is_not_charged_against_the_dead_process(cpu_baseline):
+    samples = [make_sample(1, 9.0, start_time=200.0)]
+    top_cpu, _ = system_state._top_processes(samples, 5, stub_enrich)
+    assert top_cpu[0].cpu_percent == 0.0
+
+
+def test_baseline_is_replaced_after_scan(cpu_baseline):
+    system_state._top_processes([make_sample(1, 6.0), make_sample(3, 2.0)], 5, stub_enrich)
+    assert system_state._PREV_CPU_TIMES == {(1, 100.0): 6.0, (3, 100.0): 2.0}
+    assert system_state._PREV_WALL == 12.0
+
+
+def test_exited_survivor_is_replaced_by_next_candidate(cpu_baseline):
+    samples = [
+        _ProcessSample(pid=pid, start_time=100.0, cpu_time=0.0, cpu_delta=float(pid), rss_bytes=pid)
+        for pid in range(1, 6)
+    ]
+
+    def enrich(sample, cpu_scale):
+        return None if sample.pid == 5 else stub_enrich(sample, cpu_scale)
+
+    top_cpu, top_memory = system_state._top_processes(samples, 2, enrich)
+    assert [p.pid for p in top_cpu] == [4, 3]
+    assert [p.pid for p in top_memory] == [4, 3]
+
+
+def test_ties_keep_first_seen_process_like_sorted(cpu_baseline):
+    samples = [
+        _ProcessSample(pid=pid, start_time=100.0, cpu_time=0.0, cpu_delta=1.0, rss_bytes=1024)
+        for pid in (7, 3, 9, 5)
+    ]
+    top_cpu, top_memory = system_state._top_processes(samples, 2, stub_enrich)
+    expected = [s.pid for s in sorted(samples, key=lambda s: s.cpu_delta, reverse=True)[:2]]
+    assert [p.pid for p in top_cpu] == expected == [7, 3]
+    assert [p.pid for p in top_memory] == [7, 3]
+
+
+def test_zero_top_n_returns_empty_lists(cpu_baseline):
+    assert system_state._top_processes([make_sample(1, 6.0)], 0, stub_enrich) == ([], [])
+
+
+def test_both_rankings_come_from_one_pass(cpu_baseline):
+    samples = [
+        _ProcessSample(pid=1, start_time=100.0, cpu_time=0.0, cpu_delta=3.0, rss_bytes=10),
+        _ProcessSample(pid=2, start_time=100.0, cpu_time=0.0, cpu_delta=1.0, rss_bytes=30),
+        _ProcessSample(pid=3, start_time=100.0, cpu_time=0.0, cpu_delta=2.0, rss_bytes=20),
+    ]
+    # A one-shot iterator: a second pass over it would see nothing.
+    top_cpu, top_memory = system_state._top_processes(iter(samples), 2, stub_enrich)
+    assert [p.pid for p in top_cpu] == [1, 3]
+    assert [p.pid for p in top_memory] == [2, 3]
+
+
+def test_darwin_names_are_widened_only_when_truncated(monkeypatch):
+    resolved = []
+
+    class FakeProcess:
+        def __init__(self, pid):
+            self.pid = pid
+
+        def name(self):
+            resolved.append(self.pid)
+            return "com.apple.WebKit.WebContent"
+
+    monkeypatch.setattr(system_state.psutil, "Process", FakeProcess)
+    monkeypatch.setattr(system_state, "_NAME_CACHE", OrderedDict())
+    full = _ProcessSample(pid=1, start_time=100.0, cpu_time=0.0, cpu_delta=0.0, rss_bytes=0, name="com.apple.Safari.History")
+    cut = _ProcessSample(
+        pid=2, start_time=100.0, cpu_time=0.0, cpu_delta=0.0, rss_bytes=0, name="com.apple.WebKi", name_truncated=True
+    )
+
+    assert system_state._darwin_enrich(full, 1024, 0.0).name == "com.apple.Safari.History"
+    assert system_state._darwin_enrich(cut, 1024, 0.0).name == "com.apple.WebKit.WebContent"
+    assert resolved == [2]
+
+
+def test_name_cache_misses_for_recycled_pid(monkeypatch):
+    monkeypatch.setattr(system_state, "_NAME_CACHE", OrderedDict())
+    assert system_state._process_name(7, 100.0, lambda: "old-daemon") == "old-daemon"
+    assert system_state._process_name(7, 100.0, lambda: "unused") == "old-daemon"
+    assert system_state._process_name(7, 250.0, lambda: "new-daemon") == "new-daemon"
+
+
+def test_gather_snapshot_takes_the_darwin_path(cpu_baseline, monkeypatch):
+    tasks = [
+        # (pid, start_time, name, name_truncated, cpu_time, rss_bytes)
+        _darwin_proc.TaskSample(1, 100.0, "WindowServer", False, 6.0, 300),
+        _darwin_proc.TaskSample(2, 100.0, "com.apple.WebKi", True, 4.0, 200),
+        _darwin_proc.TaskSample(3, 100.0, "kernel_task", False, 1.5, 100),
+        # PID 4 was recycled since the baseline: its new start time must not be charged the old CPU time.
+        _darwin_proc.TaskSample(4, 300.0, "mds", False, 0.5, 50),
+    ]
+    monkeypatch.setattr(_darwin_proc, "AVAILABLE", True)
+    monkeypatch.setattr(_darwin_proc, "task_samples", lambda: iter(tasks))
+    monkeypatch.setattr(system_state, "_PREV_CPU_TIMES", {(1, 100.0): 5.0, (3, 100.0): 0.5, (4, 200.0): 0.1})
+    monkeypatch.setattr(system_state, "_NAME_CACHE", OrderedDict())
+
+    def psutil_path(*args):
+        raise AssertionError("the psutil fallback must not run when libproc is available")
+
+    def exited(pid):
+        raise system_state.psutil.NoSuchProcess(pid)
+
+    monkeypatch.setattr(system_state, "_psutil_top_processes", psutil_path)
+    # PID 2 ranks second by memory but exits before its truncated name is widened; PID 3 moves up.
+    monkeypatch.setattr(system_state.psutil, "Process", exited)
+
+    snapshot = system_state.gather_snapshot(top_n=2)
+
+    # 1.0 s and 1.0 s of CPU over a 2.0 s window; PID 2 had no baseline, PID 4's start time changed.
+    assert [(p.pid, p.name, p.cpu_percent) for p in snapshot.top_cpu_processes] == [
+        (1, "WindowServer", 50.0),
+        (3, "kernel_task", 50.0),
+    ]
+    assert [p.pid for p in snapshot.top_memory_processes] == [1, 3]
+    assert system_state._PREV_CPU_TIMES == {(1, 100.0): 6.0, (2, 100.0): 4.0, (3, 100.0): 1.5, (4, 300.0): 0.5}
+
+
+def test_disk_usage_summary_keeps_partition_order(monkeypatch):
+    Partition = namedtuple("Partition", "mountpoint opts")
+    Usage = namedtuple("Usage", "total used percent")
+    partitions = [
+        Partition("/", "rw,local"),
+        Partition("/System/Volumes/Recovery", "ro,local"),
+        Partition("/Volumes/Locked", "rw,nosuid"),
+        Partition("/Volumes/Data", "rw,local"),
+    ]
+    last_queried = threading.Event()
+
+    def disk_usage(mount_point):
+        if mount_point == "/":
+            # Finish last, so a result list built in completion order would come out reversed.
+            assert last_queried.wait(timeout=5)
+            return Usage(total=500 * 1024**3, used=250 * 1024**3, percent=50.0)
+        if mount_point == "/Volumes/Locked":
+            raise PermissionError(mount_point)
+        if mount_point == "/Volumes/Data":
+            last_queried.set()
+            return Usage(total=1024**4, used=1024**3, percent=0.1)
+        raise AssertionError(f"read-only partition {mount_point} must not be queried")
+
+    monkeypatch.setattr(system_state, "_partitions_cached", lambda: partitions)
+    monkeypatch.setattr(system_state, "_MAX_WORKERS", 4)
+    monkeypatch.setattr(system_state.psutil, "disk_usage", disk_usage)
+
+    usages = system_state._disk_usage_summary()
+
+    assert [(d.mount_point, d.total_gb, d.used_gb, d.percent) for d in usages] == [
+        ("/", 500.0, 250.0, 50.0),
+        ("/Volumes/Data", 1024.0, 1.0, 0.1),
+    ]